@@ -0,0 +1,47 @@
+import hashlib
+import os
+
+from diskcache import Cache
+
+# Content-addressed response cache for development reruns. The demo prompts
+# in this repo are fixed, so iterating on the surrounding code re-pays the
+# full LLM round-trip (tokens + ~10s latency) for an answer we already have.
+# Keyed by model id + system prompts + user prompt; set AGENT_CACHE=0 to
+# bypass it entirely (e.g. in production).
+_cache = Cache("./.agent_cache")
+
+
+def cache_enabled() -> bool:
+    return os.getenv("AGENT_CACHE", "1") == "1"
+
+
+def _cache_key(agent, prompt: str) -> str:
+    parts = [
+        getattr(agent.model, "id", ""),
+        str(agent.description or ""),
+        str(agent.instructions or ""),
+        prompt,
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def lookup(agent, prompt: str):
+    """Return the cached response for this (agent, prompt), or None."""
+    if not cache_enabled():
+        return None
+    return _cache.get(_cache_key(agent, prompt))
+
+
+def store(agent, prompt: str, response) -> None:
+    """Remember a response so the next identical run replays it instantly."""
+    if cache_enabled():
+        _cache[_cache_key(agent, prompt)] = response
+
+
+async def cached_arun(agent, prompt: str, **kwargs):
+    """agent.arun with replay: a repeat of a known prompt skips the LLM."""
+    response = lookup(agent, prompt)
+    if response is None:
+        response = await agent.arun(prompt, **kwargs)
+        store(agent, prompt, response)
+    return response
@@ -1,9 +1,23 @@
+import asyncio
 import os
+import sys
 
 from agno.agent import Agent
 from agno.models.google import Gemini
 from agno.tools.arxiv import ArxivTools
 
+# uvloop's libuv-backed event loop is 2-4x faster at task scheduling and
+# socket I/O than the default asyncio loop — a free win for the gather()ed
+# agent paths below. It's optional (and unavailable on Windows).
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+from embedder_service import get_embedder
+
 # Check for API key
 api_key = os.getenv("GOOGLE_API_KEY")
 if not api_key:
@@ -61,16 +75,94 @@ agent = Agent(
 )
 
 
+# LanceDB storage + ANN index configuration. Without an explicit index LanceDB
+# falls back to a brute-force scan that is linear in the number of stored
+# vectors, so we build an IVF_HNSW_SQ index once after the initial load.
+LANCEDB_URI = "./temp_lancedb"
+LANCEDB_TABLE = "arxiv_papers"
+LANCEDB_INDEX_CONFIG = {
+    "metric": "cosine",
+    # HNSW graph per IVF cell. The SQ suffix is what delivers the byte
+    # saving: scalar quantization stores each dimension as int8 instead of
+    # FP32, so every scan moves 4x fewer bytes.
+    "index_type": "IVF_HNSW_SQ",
+    "num_partitions": 256,  # IVF cells to cluster the vectors into
+}
+
+# Query-time tuning: probing more IVF cells trades a little latency for the
+# recall the quantized index gives up.
+LANCEDB_NPROBES = 20
+
+
+# One boolean-OR query instead of three sequential ones. The arxiv client
+# sleeps delay_seconds between requests, so N queries cost (N-1) sleeps plus
+# N round-trips; a single fused search with a large page size returns all
+# matching papers in one trip.
+ARXIV_FUSED_QUERY = (
+    'ti:"Attention is All You Need" OR all:transformer OR all:"attention mechanism"'
+)
+
+
+# Written only after a load + index build has run to completion. The table
+# directory itself appears as soon as a load *starts*, and the speculative
+# race below can cancel kb_path mid-load, so the directory existing proves
+# nothing about the table being usable.
+LANCEDB_READY_MARKER = os.path.join(LANCEDB_URI, f".{LANCEDB_TABLE}.ready")
+
+
+def knowledge_base_ready():
+    """Check whether a previous run fully built and indexed the table."""
+    return os.path.exists(LANCEDB_READY_MARKER)
+
+
+async def load_knowledge_base(knowledge_base):
+    """Load the knowledge base on the first run only.
+
+    aload() re-runs the arXiv search and re-embeds documents even when the
+    table already exists, so once a previous run has completed the build we
+    skip loading entirely — the agent's vector search opens the on-disk
+    table lazily when it first queries.
+    """
+    if knowledge_base_ready():
+        return
+
+    await knowledge_base.aload(recreate=True)
+
+    # Build the ANN index once, right after the initial load. Subsequent
+    # queries get sub-linear lookups instead of a full O(dN) scan.
+    knowledge_base.vector_db.table.create_index(**LANCEDB_INDEX_CONFIG)
+
+    # Only now is the table complete and indexed; a partial load that was
+    # cancelled or crashed never writes the marker and gets rebuilt from
+    # scratch next time.
+    with open(LANCEDB_READY_MARKER, "w") as marker:
+        marker.write("")
+
+
 # Alternative approach using ArXiv Knowledge Base (more reliable for repeated access)
 def create_knowledge_based_agent():
     """Alternative approach using ArXiv Knowledge Base for better reliability"""
+    import arxiv
     from agno.knowledge.arxiv import ArxivKnowledgeBase
     from agno.vectordb.lancedb import LanceDb
 
     # Create knowledge base (this approach is more reliable for repeated queries)
     knowledge_base = ArxivKnowledgeBase(
-        queries=["Attention is All You Need", "transformer", "attention mechanism"],
-        vector_db=LanceDb(table_name="arxiv_papers", uri="./temp_lancedb"),
+        queries=[ARXIV_FUSED_QUERY],
+        vector_db=LanceDb(
+            table_name=LANCEDB_TABLE,
+            uri=LANCEDB_URI,
+            nprobes=LANCEDB_NPROBES,
+            # Warm-started, process-wide embedder: loaded once, mmap-shared
+            # with any sibling agent processes.
+            embedder=get_embedder(),
+        ),
+    )
+
+    # page_size=1000 lets the single fused query come back in one paginated
+    # request instead of the default small pages.
+    knowledge_base.reader.client = arxiv.Client(
+        page_size=1000, delay_seconds=3, num_retries=3
     )
 
     # Create agent with knowledge base
@@ -110,42 +202,92 @@ def create_knowledge_based_agent():
     return kb_agent, knowledge_base
 
 
+# Handnotes that are missing this section header are treated as invalid and
+# lose the race, even if their path finished first.
+REQUIRED_SECTION = "## 📜 The Gist"
+
+
+async def collect_response(streaming_agent, prompt):
+    """Stream a response and return the full text once it completes."""
+    chunks = []
+    async for event in streaming_agent.arun(prompt, stream=True):
+        if event.content:
+            chunks.append(event.content)
+    return "".join(chunks)
+
+
+async def arxiv_path(paper_title):
+    """Primary path: search + read the paper through ArxivTools."""
+    return await collect_response(agent, f"Analyze the paper: {paper_title}")
+
+
+async def kb_path(paper_title):
+    """Knowledge-base path: load (or reuse) the LanceDB table, then query it."""
+    kb_agent, knowledge_base = create_knowledge_based_agent()
+    await load_knowledge_base(knowledge_base)
+    return await collect_response(
+        kb_agent, f"Tell me about the '{paper_title}' paper"
+    )
+
+
+async def fallback_path(paper_title):
+    """Cheapest path: the model's own knowledge, no tools at all."""
+    fallback_agent = Agent(model=Gemini(id="gemini-2.0-flash"), markdown=True)
+    return await collect_response(
+        fallback_agent,
+        f"Based on your knowledge, create brilliant handnotes for the paper "
+        f"'{paper_title}', starting with a '{REQUIRED_SECTION}' section. Focus on "
+        f"the transformer architecture and attention mechanism.",
+    )
+
+
+def is_valid_handnotes(text):
+    return isinstance(text, str) and REQUIRED_SECTION in text
+
+
+async def race_for_handnotes(paper_title):
+    """Run all three paths speculatively and keep the first valid answer.
+
+    The old cascade only advanced to the next path after the previous one
+    raised, so the worst case (ArxivTools timing out) cost the sum of every
+    timeout. Racing them bounds the wall time by the fastest path that
+    produces valid handnotes; the losers are cancelled.
+    """
+    tasks = {
+        asyncio.create_task(path(paper_title))
+        for path in (arxiv_path, kb_path, fallback_path)
+    }
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None and is_valid_handnotes(task.result()):
+                    return task.result()
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 # Run the agent
-if __name__ == "__main__":
+async def main():
+    sys.stdout.reconfigure(line_buffering=False, write_through=True)
+
     paper_title = "Attention is All You Need"
 
-    print("🤖 Trying ArxivTools approach...")
+    print("🤖 Racing ArxivTools, knowledge-base and general-knowledge paths...")
     print("-" * 60)
 
-    try:
-        agent.print_response(f"Analyze the paper: {paper_title}", stream=True)
-    except Exception as e:
-        print(f"❌ ArxivTools failed: {e}")
-        print("\n🔄 Trying Knowledge Base approach...")
-        print("-" * 60)
-
-        try:
-            kb_agent, knowledge_base = create_knowledge_based_agent()
-
-            # Load the knowledge base (comment out after first run)
-            print("📚 Loading knowledge base...")
-            knowledge_base.load(recreate=True)
-
-            # Query the knowledge base
-            kb_agent.print_response(
-                f"Tell me about the '{paper_title}' paper", stream=True
-            )
+    notes = await race_for_handnotes(paper_title)
 
-        except Exception as kb_error:
-            print(f"❌ Knowledge Base approach also failed: {kb_error}")
-            print("\n💡 Fallback: Using general knowledge...")
+    if notes is not None:
+        sys.stdout.write(notes + "\n")
+        sys.stdout.flush()
+    else:
+        print("❌ All approaches failed to produce valid handnotes.")
 
-            # Fallback to general knowledge
-            fallback_agent = Agent(model=Gemini(id="gemini-2.0-flash"), markdown=True)
 
-            fallback_agent.print_response(
-                f"Based on your knowledge, create handnotes for the paper '{paper_title}' "
-                f"using the format I specified earlier. Focus on the transformer architecture "
-                f"and attention mechanism.",
-                stream=True,
-            )
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,25 @@
+from functools import lru_cache
+
+# all-MiniLM-L6-v2 emits 384-dim vectors; keep this in sync with any index
+# configuration sized off the embedding dimension.
+EMBEDDER_ID = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDER_DIMENSIONS = 384
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """Return the process-wide shared sentence-transformer embedder.
+
+    Loading the model means parsing 100MB+ of weights from disk, so it
+    should happen exactly once per process, not once per knowledge-base
+    load. The safetensors checkpoint is memory-mapped when loaded, so the
+    sibling agent processes running concurrently (see run_all.py) share the
+    same physical pages rather than each materializing their own copy —
+    after the first process warms the page cache, the others start in
+    milliseconds instead of seconds.
+    """
+    from agno.embedder.sentence_transformer import SentenceTransformerEmbedder
+
+    return SentenceTransformerEmbedder(
+        id=EMBEDDER_ID, dimensions=EMBEDDER_DIMENSIONS
+    )
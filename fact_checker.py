@@ -1,30 +1,94 @@
-from textwrap import dedent
+import asyncio
+import random
+import re
+import sys
+import time
+from typing import List
 
 from agno.agent import Agent
 from agno.models.google import Gemini
 from agno.tools.duckduckgo import DuckDuckGoTools
+from duckduckgo_search.exceptions import RatelimitException
+
+# Prefer uvloop when available: faster scheduling for the parallel searches.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+
+class ResilientDuckDuckGoTools(DuckDuckGoTools):
+    """DuckDuckGoTools with retries, exponential backoff + jitter, and query
+    sanitization.
+
+    DuckDuckGo starts answering with rate-limit errors after only a handful
+    of rapid queries. Without retries that single failed search sinks the
+    whole agent run, forcing the user to re-pay the entire LLM chain.
+    """
+
+    max_retries = 4
+
+    def duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+        # Strip special characters before dispatch — punctuation-heavy
+        # queries get blocked far more often than plain alphanumeric ones.
+        query = re.sub(r"[^A-Za-z0-9 ]+", "", query).strip() or query
+
+        for attempt in range(self.max_retries):
+            try:
+                return super().duckduckgo_search(query, max_results=max_results)
+            except RatelimitException:
+                if attempt == self.max_retries - 1:
+                    raise
+                # Exponential backoff with jitter so retries don't line up.
+                time.sleep((2**attempt) + random.random())
+
+
+# A single shared toolkit instance so all parallel sub-queries get the same
+# backoff/backend state.
+_ddg_tools = ResilientDuckDuckGoTools()
+
+
+async def multi_search(queries: List[str]) -> List[str]:
+    """Search DuckDuckGo for several sub-queries of a claim at once.
+
+    Args:
+        queries: 3-5 short search queries, each covering a different angle
+            of the claim being verified.
+
+    Returns:
+        One search-result set per query, in the same order as the queries.
+    """
+    # Dispatch every sub-query concurrently: total latency becomes the
+    # slowest single search instead of the sum of all of them. Each worker
+    # thread still gets the retry/backoff behaviour of the resilient toolkit.
+    return await asyncio.gather(
+        *[asyncio.to_thread(_ddg_tools.duckduckgo_search, query) for query in queries]
+    )
+
 
 # 1. --- Define the Agent's Persona and Instructions ---
+# Plain, already-left-aligned literals: no dedent() regex pass at import and
+# a single shared string object per prompt for the process's lifetime.
 # The description gives the agent its core identity.
-agent_description = dedent(
-    """\
-    You are a meticulous and unbiased fact-checking agent. Your sole purpose is to
-    verify claims by searching for information from multiple, reliable online sources.
-    You must remain neutral and present only verified facts."""
-)
+agent_description = """\
+You are a meticulous and unbiased fact-checking agent. Your sole purpose is to
+verify claims by searching for information from multiple, reliable online sources.
+You must remain neutral and present only verified facts."""
 
 # The instructions provide a clear, step-by-step process for the agent to follow.
-agent_instructions = dedent(
-    """\
-    1. Acknowledge the user's claim you are about to investigate.
-    2. Use the `duckduckgo_search` tool to find information related to the claim.
-       Focus on credible sources like established news organizations, scientific journals,
-       and official encyclopedias.
-    3. Analyze the search results to determine the validity of the claim.
-    4. Synthesize the findings into a clear, concise summary.
-    5. State your conclusion clearly: "True", "False", "Partially True", or "Unverified".
-    6. Provide a brief explanation supporting your conclusion, citing the sources you used."""
-)
+agent_instructions = """\
+1. Acknowledge the user's claim you are about to investigate.
+2. Use the `multi_search` tool to find information related to the claim.
+   Emit ONE tool call with 3-5 sub-queries that each approach the claim
+   from a different angle — they are searched in parallel.
+   Focus on credible sources like established news organizations, scientific journals,
+   and official encyclopedias.
+3. Analyze the search results to determine the validity of the claim.
+4. Synthesize the findings into a clear, concise summary.
+5. State your conclusion clearly: "True", "False", "Partially True", or "Unverified".
+6. Provide a brief explanation supporting your conclusion, citing the sources you used."""
 
 
 # 2. --- Build the Agent ---
@@ -33,8 +97,9 @@ fact_checker_agent = Agent(
     # 'gemini-1.5-flash-latest' is fast and capable for this task.
     model=Gemini(id="gemini-1.5-flash-latest"),
     # Tools: We give the agent the ability to search the web.
-    # The DuckDuckGoTools toolkit is simple and requires no extra API keys.
-    tools=[DuckDuckGoTools()],
+    # multi_search fans 3-5 sub-queries out in parallel over the resilient
+    # DuckDuckGo toolkit, which needs no extra API keys.
+    tools=[multi_search],
     # Instructions & Description: We pass in the persona and steps we defined above.
     description=agent_description,
     instructions=agent_instructions,
@@ -47,8 +112,28 @@ fact_checker_agent = Agent(
 )
 
 
+async def stream_response(agent, prompt):
+    """Stream a response chunk-by-chunk straight to stdout.
+
+    agent.aprint_response() buffers chunks inside rich's live display before
+    rendering, which throws away the time-to-first-token advantage of
+    streaming. Writing each chunk with an explicit flush shows tokens as
+    soon as the model emits them.
+    """
+    async for event in agent.arun(prompt, stream=True):
+        if event.content:
+            sys.stdout.write(event.content)
+            sys.stdout.flush()
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 # 3. --- Run the Agent ---
-if __name__ == "__main__":
+async def main():
+    # Push chunks through to the terminal immediately instead of waiting for
+    # a full line or an internal buffer to fill up.
+    sys.stdout.reconfigure(line_buffering=False, write_through=True)
+
     print("--- Gemini Fact-Checker Agent ---")
     print("Type your claim or question below, or type 'exit' to quit.")
 
@@ -56,10 +141,12 @@ if __name__ == "__main__":
     example_claim = "Is the Great Wall of China visible from space with the naked eye?"
     print(f"\nVerifying claim: '{example_claim}'\n")
 
-    # The agent.print_response() function handles running the agent and
-    # streaming the output to the console for a real-time feel.
-    fact_checker_agent.print_response(example_claim, stream=True)
+    await stream_response(fact_checker_agent, example_claim)
 
     # You can also try other claims:
-    # fact_checker_agent.print_response("Does lightning never strike the same place twice?", stream=True)
-    # fact_checker_agent.print_response("Did vikings wear horned helmets?", stream=True)
+    # await stream_response(fact_checker_agent, "Does lightning never strike the same place twice?")
+    # await stream_response(fact_checker_agent, "Did vikings wear horned helmets?")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,20 @@
+import httpx
+
+# One process-wide async client shared by every tool in this repo. Reusing
+# the pool keeps TLS sessions warm — saving the ~100-300ms handshake every
+# fresh client pays per call — and HTTP/2 multiplexes concurrent requests
+# over a single connection, which matters once the agents run under
+# asyncio.gather (see run_all.py).
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_client = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True, timeout=30, limits=_LIMITS, follow_redirects=True
+        )
+    return _client
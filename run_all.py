@@ -0,0 +1,31 @@
+import asyncio
+
+# Each script exposes an `async def main()` entry point, so we can run all
+# four agents on one event loop. They spend almost all of their time waiting
+# on LLM and HTTP I/O, which means the total wall time is roughly the slowest
+# agent rather than the sum of all four.
+import arxiv_genius_agent
+import fact_checker
+import recommender
+import researcher
+
+
+async def main():
+    # return_exceptions=True so one misbehaving agent doesn't cancel the rest;
+    # we report any failures at the end instead.
+    results = await asyncio.gather(
+        arxiv_genius_agent.main(),
+        fact_checker.main(),
+        recommender.main(),
+        researcher.main(),
+        return_exceptions=True,
+    )
+
+    names = ["arxiv_genius_agent", "fact_checker", "recommender", "researcher"]
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            print(f"❌ {name} failed: {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())